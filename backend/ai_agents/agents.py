@@ -1,8 +1,9 @@
 # Extensible AI agents with LangChain and MCP support
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 import os
 import logging
+import httpx
 from dataclasses import dataclass
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -18,6 +19,8 @@ class AgentConfig:
     api_base_url: str = None
     model_name: str = None
     api_key: str = None
+    # Shared async HTTP client for LLM calls (connection reuse)
+    http_async_client: Optional[httpx.AsyncClient] = None
     
     def __post_init__(self):
         # Load from env if not provided
@@ -49,17 +52,22 @@ class BaseAgent:
         self.llm = ChatOpenAI(
             base_url=config.api_base_url,
             api_key=config.api_key,
-            model=config.model_name
+            model=config.model_name,
+            http_async_client=config.http_async_client
         )
         
         # MCP client lazy init
         self.mcp_client: Optional[MultiServerMCPClient] = None
         self.mcp_tools = []
+
+        # Capabilities cache, reset on MCP setup
+        self._capabilities: Optional[List[str]] = None
         
         logger.info(f"Initialized {self.__class__.__name__} with model {config.model_name}")
     
     def setup_mcp(self, server_configs: List[Dict[str, str]]):
         # Setup MCP servers
+        self._capabilities = None
         try:
             self.mcp_client = MultiServerMCPClient(server_configs)
             # Tools bound when needed
@@ -103,12 +111,30 @@ class BaseAgent:
                 error=str(e)
             )
     
+    async def stream(self, prompt: str, use_tools: bool = True) -> AsyncIterator[str]:
+        # Stream agent output chunks as they arrive
+        messages = [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=prompt)
+        ]
+
+        if use_tools and self.mcp_client and self.mcp_tools:
+            runnable = self.llm.bind_tools(self.mcp_tools)
+        else:
+            runnable = self.llm
+
+        async for chunk in runnable.astream(messages):
+            if chunk.content:
+                yield chunk.content
+    
     def get_capabilities(self) -> List[str]:
         # Get agent capabilities
-        capabilities = ["text_generation", "conversation"]
-        if self.mcp_client:
-            capabilities.append("mcp_enabled")
-        return capabilities
+        if self._capabilities is None:
+            capabilities = ["text_generation", "conversation"]
+            if self.mcp_client:
+                capabilities.append("mcp_enabled")
+            self._capabilities = capabilities
+        return self._capabilities
 
 
 class SearchAgent(BaseAgent):
@@ -1,17 +1,26 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 import os
+import re
+import asyncio
+import copy
 import logging
+import time
+import orjson
+import httpx
 from pathlib import Path
+from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, List, Literal, Optional, Tuple
 import uuid
 from datetime import datetime
 
 # AI agents
-from ai_agents.agents import AgentConfig, SearchAgent, ChatAgent, RecipeAgent
+from ai_agents.agents import AgentConfig, BaseAgent, SearchAgent, ChatAgent, RecipeAgent
 
 
 ROOT_DIR = Path(__file__).parent
@@ -19,20 +28,187 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=10,
+    serverSelectionTimeoutMS=5000,
+    waitQueueTimeoutMS=2000
+)
 db = client[os.environ['DB_NAME']]
 
 # AI agents init
 agent_config = AgentConfig()
-search_agent: Optional[SearchAgent] = None
-chat_agent: Optional[ChatAgent] = None
-recipe_agent: Optional[RecipeAgent] = None
+AGENTS: Dict[str, BaseAgent] = {}
+CAPABILITIES: dict = {}
+
+# JSON block in LLM recipe output
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Recipe JSON format spec appended to every recipe prompt
+_RECIPE_JSON_SCHEMA = """
+{
+  "name": "Recipe Name",
+  "description": "Brief description",
+  "prep_time": "X minutes",
+  "cook_time": "X minutes",
+  "servings": "X",
+  "difficulty": "Easy/Medium/Hard",
+  "ingredients": [
+    {"item": "ingredient name", "amount": "quantity", "unit": "unit"}
+  ],
+  "instructions": [
+    {"step": 1, "instruction": "First step"},
+    {"step": 2, "instruction": "Second step"}
+  ],
+  "tips": ["helpful tip 1", "helpful tip 2"],
+  "nutrition": {
+    "calories": "approximate calories per serving",
+    "protein": "protein content",
+    "carbs": "carbohydrate content",
+    "fat": "fat content"
+  }
+}"""
+
+# Static parts of the fallback recipe, copied on parse failure
+_RECIPE_FALLBACK_INSTRUCTIONS = [
+    {"step": 2, "instruction": "Heat oil in a large pan over medium heat"},
+    {"step": 3, "instruction": "Add ingredients and cook according to recipe requirements"},
+    {"step": 4, "instruction": "Season with salt, pepper, and herbs to taste"},
+    {"step": 5, "instruction": "Serve hot and enjoy!"}
+]
+_RECIPE_FALLBACK_TEMPLATE = {
+    "name": None,
+    "description": None,
+    "prep_time": "15 minutes",
+    "cook_time": "30 minutes",
+    "servings": "4",
+    "difficulty": "Medium",
+    "ingredients": [],
+    "instructions": _RECIPE_FALLBACK_INSTRUCTIONS,
+    "tips": [
+        "Adjust seasoning to taste",
+        "Feel free to substitute ingredients based on availability"
+    ],
+    "nutrition": {
+        "calories": "300-400 per serving",
+        "protein": "15-25g",
+        "carbs": "20-40g",
+        "fat": "10-20g"
+    }
+}
+
+# Exact-match response cache for LLM endpoints
+RECIPE_CACHE_TTL = 24 * 60 * 60
+SEARCH_CACHE_TTL = 15 * 60
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+
+def _cache_get(key: Tuple) -> Optional[Any]:
+    # Get unexpired cached response
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _response_cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_set(key: Tuple, value: Any, ttl: float):
+    # Store response, evicting the oldest entry when full
+    if key not in _response_cache and len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[key] = (time.monotonic() + ttl, value)
+
+
+async def _create_indexes():
+    # Index backing the newest-first status listing
+    try:
+        await db.status_checks.create_index([("timestamp", -1)])
+    except Exception as e:
+        logger.error(f"Failed to create status_checks index: {e}")
+
+
+async def _init_agents():
+    # Build agents off the event loop, keeping construction off the request path
+    try:
+        search_agent, chat_agent, recipe_agent = await asyncio.gather(
+            asyncio.to_thread(SearchAgent, agent_config),
+            asyncio.to_thread(ChatAgent, agent_config),
+            asyncio.to_thread(RecipeAgent, agent_config)
+        )
+    except Exception as e:
+        # Fail startup rather than serve with no agents
+        logger.error(f"Failed to initialize agents: {e}")
+        raise
+    AGENTS.update(search=search_agent, chat=chat_agent, recipe=recipe_agent)
+    CAPABILITIES.update({
+        "search_agent": search_agent.get_capabilities(),
+        "chat_agent": chat_agent.get_capabilities()
+    })
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup tasks run concurrently; Mongo ping and agent init fail fast
+    logger.info("Starting AI Agents API...")
+
+    # Pooled HTTP/2 client shared by all agents' LLM calls, closed on exit
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    ) as shared_http:
+        agent_config.http_async_client = shared_http
+        try:
+            await asyncio.gather(
+                client.admin.command("ping"),
+                _create_indexes(),
+                _init_agents()
+            )
+            logger.info("AI Agents API ready!")
+
+            yield
+        finally:
+            # Cleanup on shutdown or failed startup (MCP cleanup is automatic)
+            agent_config.http_async_client = None
+            await client.close()
+            logger.info("AI Agents API shutdown complete.")
+
 
 # Main app
-app = FastAPI(title="AI Agents API", description="Minimal AI Agents API with LangGraph and MCP support")
+app = FastAPI(
+    title="AI Agents API",
+    description="Minimal AI Agents API with LangGraph and MCP support",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+
+class ORJSONRequest(Request):
+    # Request with orjson body parsing
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    # Route parsing JSON bodies with orjson before Pydantic validation
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
 
 # API router
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", route_class=ORJSONRoute)
 
 
 # Models
@@ -48,7 +224,7 @@ class StatusCheckCreate(BaseModel):
 # AI agent models
 class ChatRequest(BaseModel):
     message: str
-    agent_type: str = "chat"  # "chat" or "search"
+    agent_type: Literal["chat", "search"] = "chat"
     context: Optional[dict] = None
 
 
@@ -88,6 +264,95 @@ class RecipeResponse(BaseModel):
     recipe: dict
     error: Optional[str] = None
 
+
+def _build_search_prompt(query: str) -> str:
+    # Search prompt for the search agent
+    return f"Search for information about: {query}. Provide a comprehensive summary with key findings."
+
+
+def _build_recipe_prompt(request: RecipeRequest) -> str:
+    # Recipe generation prompt with JSON format spec
+    ingredients_list = ", ".join(request.ingredients)
+    prompt_parts = [f"Create a detailed recipe using these ingredients: {ingredients_list}"]
+
+    if request.dietary_restrictions:
+        restrictions = ", ".join(request.dietary_restrictions)
+        prompt_parts.append(f"Dietary restrictions: {restrictions}")
+
+    if request.cuisine_type:
+        prompt_parts.append(f"Cuisine type: {request.cuisine_type}")
+
+    if request.meal_type:
+        prompt_parts.append(f"Meal type: {request.meal_type}")
+
+    if request.cooking_time:
+        prompt_parts.append(f"Cooking time preference: {request.cooking_time}")
+
+    prompt_parts.append(_RECIPE_JSON_SCHEMA)
+
+    return "\n".join(prompt_parts)
+
+
+def _build_fallback_recipe(request: RecipeRequest) -> dict:
+    # Structured placeholder recipe when LLM output can't be parsed
+    ingredients_list = ", ".join(request.ingredients)
+    cuisine = request.cuisine_type.title() if request.cuisine_type else ""
+    meal = request.meal_type.title() if request.meal_type else "Dish"
+    restrictions = ", ".join(request.dietary_restrictions) if request.dietary_restrictions else "no dietary restrictions"
+
+    recipe_data = copy.deepcopy(_RECIPE_FALLBACK_TEMPLATE)
+    recipe_data["name"] = f"{cuisine} {meal} with {', '.join(request.ingredients[:2])}".strip()
+    recipe_data["description"] = f"A delicious recipe using {ingredients_list} with {restrictions}"
+    if request.cooking_time:
+        recipe_data["cook_time"] = request.cooking_time
+    recipe_data["ingredients"] = [
+        {"item": ing, "amount": "1-2", "unit": "portions"} for ing in request.ingredients
+    ]
+    recipe_data["instructions"].insert(0, {"step": 1, "instruction": f"Prepare all ingredients: {ingredients_list}"})
+    return recipe_data
+
+
+def _sse_event(data: dict, event: Optional[str] = None) -> bytes:
+    # Encode one Server-Sent Event
+    payload = b"data: " + orjson.dumps(data) + b"\n\n"
+    if event:
+        payload = f"event: {event}\n".encode() + payload
+    return payload
+
+
+def _get_agent(agent_type: str) -> BaseAgent:
+    # Registered agent, or 503 if startup never populated it
+    agent = AGENTS.get(agent_type)
+    if agent is None:
+        raise HTTPException(status_code=503, detail="Agents not initialized")
+    return agent
+
+
+def _sse_response(events: AsyncIterator[bytes]) -> StreamingResponse:
+    # SSE response, with proxy buffering and caching disabled
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _dict_response(content: dict) -> ORJSONResponse:
+    # Serialize a trusted response dict directly, skipping response_model validation
+    return ORJSONResponse(content=content)
+
+
+async def _stream_agent(agent, prompt: str, use_tools: bool = True) -> AsyncIterator[bytes]:
+    # Relay agent output chunks as SSE
+    try:
+        async for chunk in agent.stream(prompt, use_tools=use_tools):
+            yield _sse_event({"content": chunk})
+        yield _sse_event({"success": True}, event="done")
+    except Exception as e:
+        logger.error(f"Error streaming agent response: {e}")
+        yield _sse_event({"success": False, "error": str(e)}, event="error")
+
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -95,251 +360,208 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    status_obj = StatusCheck(client_name=input.client_name)
+    await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    cursor = db.status_checks.find(
+        {},
+        {"id": 1, "client_name": 1, "timestamp": 1, "_id": 0}
+    ).sort("timestamp", -1).limit(1000)
+
+    # Build incrementally so the loop is released between batches
+    status_checks = []
+    async for status_check in cursor:
+        status_checks.append(StatusCheck(**status_check))
+    return status_checks
 
 
 # AI agent routes
-@api_router.post("/chat", response_model=ChatResponse)
+@api_router.post("/chat", responses={200: {"model": ChatResponse}})
 async def chat_with_agent(request: ChatRequest):
     # Chat with AI agent
-    global search_agent, chat_agent
-    
+    agent = _get_agent(request.agent_type)
+
     try:
-        # Init agents if needed
-        if request.agent_type == "search" and search_agent is None:
-            search_agent = SearchAgent(agent_config)
-            
-        elif request.agent_type == "chat" and chat_agent is None:
-            chat_agent = ChatAgent(agent_config)
-        
-        # Select agent
-        agent = search_agent if request.agent_type == "search" else chat_agent
-        
-        if agent is None:
-            raise HTTPException(status_code=500, detail="Failed to initialize agent")
-        
         # Execute agent
         response = await agent.execute(request.message)
         
-        return ChatResponse(
+        return _dict_response(ChatResponse(
             success=response.success,
             response=response.content,
             agent_type=request.agent_type,
             capabilities=agent.get_capabilities(),
             metadata=response.metadata,
             error=response.error
-        )
+        ).model_dump())
         
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
-        return ChatResponse(
+        return _dict_response(ChatResponse(
             success=False,
             response="",
             agent_type=request.agent_type,
             capabilities=[],
             error=str(e)
-        )
+        ).model_dump())
+
 
+@api_router.post("/chat/stream")
+async def chat_with_agent_stream(request: ChatRequest):
+    # Chat with AI agent, streamed as SSE
+    agent = _get_agent(request.agent_type)
+    return _sse_response(_stream_agent(agent, request.message))
 
-@api_router.post("/search", response_model=SearchResponse)
+
+@api_router.post("/search", responses={200: {"model": SearchResponse}})
 async def search_and_summarize(request: SearchRequest):
     # Web search with AI summary
-    global search_agent
-    
+    search_agent = _get_agent("search")
+
     try:
-        # Init search agent if needed
-        if search_agent is None:
-            search_agent = SearchAgent(agent_config)
-        
+        cache_key = ("search", request.query, request.max_results)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return _dict_response(cached)
+
         # Search with agent
-        search_prompt = f"Search for information about: {request.query}. Provide a comprehensive summary with key findings."
+        search_prompt = _build_search_prompt(request.query)
         result = await search_agent.execute(search_prompt, use_tools=True)
         
         if result.success:
-            return SearchResponse(
+            response = SearchResponse(
                 success=True,
                 query=request.query,
                 summary=result.content,
                 search_results=result.metadata,
                 sources_count=result.metadata.get("tools_used", 0)
             )
+            content = response.model_dump()
+            _cache_set(cache_key, content, SEARCH_CACHE_TTL)
+            return _dict_response(content)
         else:
-            return SearchResponse(
+            return _dict_response(SearchResponse(
                 success=False,
                 query=request.query,
                 summary="",
                 sources_count=0,
                 error=result.error
-            )
+            ).model_dump())
             
     except Exception as e:
         logger.error(f"Error in search endpoint: {e}")
-        return SearchResponse(
+        return _dict_response(SearchResponse(
             success=False,
             query=request.query,
             summary="",
             sources_count=0,
             error=str(e)
-        )
+        ).model_dump())
+
+
+@api_router.post("/search/stream")
+async def search_and_summarize_stream(request: SearchRequest):
+    # Web search with AI summary, streamed as SSE
+    search_prompt = _build_search_prompt(request.query)
+    return _sse_response(_stream_agent(_get_agent("search"), search_prompt))
 
 
 @api_router.get("/agents/capabilities")
 async def get_agent_capabilities():
-    # Get agent capabilities
-    try:
-        capabilities = {
-            "search_agent": SearchAgent(agent_config).get_capabilities(),
-            "chat_agent": ChatAgent(agent_config).get_capabilities()
-        }
-        return {
-            "success": True,
-            "capabilities": capabilities
-        }
-    except Exception as e:
-        logger.error(f"Error getting capabilities: {e}")
+    # Get agent capabilities (precomputed on startup)
+    if not CAPABILITIES:
         return {
             "success": False,
-            "error": str(e)
+            "error": "Agents not initialized"
         }
+    return {
+        "success": True,
+        "capabilities": CAPABILITIES
+    }
 
 
-@api_router.post("/recipes/generate", response_model=RecipeResponse)
+@api_router.post("/recipes/generate", responses={200: {"model": RecipeResponse}})
 async def generate_recipe(request: RecipeRequest):
     # Generate a recipe using specialized AI agent
-    global recipe_agent
+    recipe_agent = _get_agent("recipe")
 
     try:
-        # Init recipe agent if needed
-        if recipe_agent is None:
-            recipe_agent = RecipeAgent(agent_config)
-
-        # Build recipe generation prompt
-        ingredients_list = ", ".join(request.ingredients)
-        prompt_parts = [f"Create a detailed recipe using these ingredients: {ingredients_list}"]
-
-        if request.dietary_restrictions:
-            restrictions = ", ".join(request.dietary_restrictions)
-            prompt_parts.append(f"Dietary restrictions: {restrictions}")
-
-        if request.cuisine_type:
-            prompt_parts.append(f"Cuisine type: {request.cuisine_type}")
-
-        if request.meal_type:
-            prompt_parts.append(f"Meal type: {request.meal_type}")
-
-        if request.cooking_time:
-            prompt_parts.append(f"Cooking time preference: {request.cooking_time}")
-
-        prompt_parts.append("""
-{
-  "name": "Recipe Name",
-  "description": "Brief description",
-  "prep_time": "X minutes",
-  "cook_time": "X minutes",
-  "servings": "X",
-  "difficulty": "Easy/Medium/Hard",
-  "ingredients": [
-    {"item": "ingredient name", "amount": "quantity", "unit": "unit"}
-  ],
-  "instructions": [
-    {"step": 1, "instruction": "First step"},
-    {"step": 2, "instruction": "Second step"}
-  ],
-  "tips": ["helpful tip 1", "helpful tip 2"],
-  "nutrition": {
-    "calories": "approximate calories per serving",
-    "protein": "protein content",
-    "carbs": "carbohydrate content",
-    "fat": "fat content"
-  }
-}""")
+        cache_key = (
+            "recipe",
+            tuple(sorted(request.ingredients)),
+            tuple(sorted(request.dietary_restrictions or [])),
+            request.cuisine_type,
+            request.meal_type,
+            request.cooking_time
+        )
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return _dict_response(cached)
 
-        recipe_prompt = "\n".join(prompt_parts)
+        recipe_prompt = _build_recipe_prompt(request)
 
         # Execute agent
         result = await recipe_agent.execute(recipe_prompt)
 
         if result.success:
             # Try to parse as JSON, fallback to structured text
-            import json
-            import re
-
-            content = result.content.strip()
+            llm_output = result.content.strip()
 
             # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(llm_output)
             if json_match:
                 json_str = json_match.group()
             else:
-                json_str = content
+                json_str = llm_output
 
             try:
-                recipe_data = json.loads(json_str)
+                recipe_data = orjson.loads(json_str)
 
                 # Validate required fields
                 required_fields = ['name', 'description', 'prep_time', 'cook_time', 'servings', 'difficulty', 'ingredients', 'instructions']
                 for field in required_fields:
                     if field not in recipe_data:
                         raise ValueError(f"Missing required field: {field}")
+                parsed = True
 
-            except (json.JSONDecodeError, ValueError) as e:
+            except (orjson.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Failed to parse recipe JSON: {e}, falling back to structured data")
+                parsed = False
                 # If JSON parsing fails, create structured data from text
-                recipe_data = {
-                    "name": f"{request.cuisine_type.title() if request.cuisine_type else ''} {request.meal_type.title() if request.meal_type else 'Dish'} with {', '.join(request.ingredients[:2])}".strip(),
-                    "description": f"A delicious recipe using {', '.join(request.ingredients)} with {', '.join(request.dietary_restrictions) if request.dietary_restrictions else 'no dietary restrictions'}",
-                    "prep_time": "15 minutes",
-                    "cook_time": request.cooking_time or "30 minutes",
-                    "servings": "4",
-                    "difficulty": "Medium",
-                    "ingredients": [
-                        {"item": ing, "amount": "1-2", "unit": "portions"} for ing in request.ingredients
-                    ],
-                    "instructions": [
-                        {"step": 1, "instruction": f"Prepare all ingredients: {', '.join(request.ingredients)}"},
-                        {"step": 2, "instruction": "Heat oil in a large pan over medium heat"},
-                        {"step": 3, "instruction": "Add ingredients and cook according to recipe requirements"},
-                        {"step": 4, "instruction": "Season with salt, pepper, and herbs to taste"},
-                        {"step": 5, "instruction": "Serve hot and enjoy!"}
-                    ],
-                    "tips": [
-                        "Adjust seasoning to taste",
-                        "Feel free to substitute ingredients based on availability"
-                    ],
-                    "nutrition": {
-                        "calories": "300-400 per serving",
-                        "protein": "15-25g",
-                        "carbs": "20-40g",
-                        "fat": "10-20g"
-                    }
-                }
-
-            return RecipeResponse(
+                recipe_data = _build_fallback_recipe(request)
+
+            response = RecipeResponse(
                 success=True,
                 recipe=recipe_data
             )
+            content = response.model_dump()
+            # Fallback recipes are not worth caching
+            if parsed:
+                _cache_set(cache_key, content, RECIPE_CACHE_TTL)
+            return _dict_response(content)
         else:
-            return RecipeResponse(
+            return _dict_response(RecipeResponse(
                 success=False,
                 recipe={},
                 error=result.error
-            )
+            ).model_dump())
 
     except Exception as e:
         logger.error(f"Error in recipe generation endpoint: {e}")
-        return RecipeResponse(
+        return _dict_response(RecipeResponse(
             success=False,
             recipe={},
             error=str(e)
-        )
+        ).model_dump())
+
+
+@api_router.post("/recipes/generate/stream")
+async def generate_recipe_stream(request: RecipeRequest):
+    # Generate a recipe, streaming raw JSON chunks as SSE
+    recipe_prompt = _build_recipe_prompt(request)
+    return _sse_response(_stream_agent(_get_agent("recipe"), recipe_prompt))
 
 # Include router
 app.include_router(api_router)
@@ -347,9 +569,10 @@ app.include_router(api_router)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[origin.strip() for origin in os.environ.get("CORS_ORIGINS", "*").split(",") if origin.strip()],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 # Logging config
@@ -359,25 +582,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("startup")
-async def startup_event():
-    # Initialize agents on startup
-    global search_agent, chat_agent
-    logger.info("Starting AI Agents API...")
-    
-    # Lazy agent init for faster startup
-    logger.info("AI Agents API ready!")
-
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    # Cleanup on shutdown
-    global search_agent, chat_agent
-    
-    # Close MCP
-    if search_agent and search_agent.mcp_client:
-        # MCP cleanup automatic
-        pass
-    
-    client.close()
-    logger.info("AI Agents API shutdown complete.")
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # libuv event loop for lower per-request overhead
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop")
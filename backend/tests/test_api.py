@@ -94,6 +94,22 @@ def test_server_endpoints():
         print(f"❌ Capabilities endpoint failed: {e}")
         return False
     
+    # Chat validation test
+    print("\n5️⃣ Testing chat agent_type validation...")
+    try:
+        payload = {
+            "message": "Hello",
+            "agent_type": "unknown"
+        }
+        
+        response = requests.post(f"{base_url}/chat", json=payload)
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+        
+        print("✅ Unknown agent_type rejected")
+    except Exception as e:
+        print(f"❌ Chat validation failed: {e}")
+        return False
+    
     return True
 
 
@@ -0,0 +1,92 @@
+# Response cache tests (no LLM or running server needed)
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import server
+from ai_agents import AgentResponse
+
+
+class StubRecipeAgent:
+    # Recipe agent returning non-JSON text to force the fallback recipe
+    async def execute(self, prompt: str, use_tools: bool = True) -> AgentResponse:
+        return AgentResponse(success=True, content="Not a JSON recipe")
+
+
+def test_cache_expiry():
+    # Expired entries are dropped on read
+    server._response_cache.clear()
+
+    server._cache_set(("k", 1), {"v": 1}, 60)
+    assert server._cache_get(("k", 1)) == {"v": 1}, "Fresh entry not returned"
+
+    server._cache_set(("k", 2), {"v": 2}, -1)
+    assert server._cache_get(("k", 2)) is None, "Expired entry returned"
+    assert ("k", 2) not in server._response_cache, "Expired entry not evicted"
+    print("✅ Cache expiry working")
+
+
+def test_cache_eviction():
+    # Oldest entry evicted once the cache is full
+    server._response_cache.clear()
+    max_entries = server.RESPONSE_CACHE_MAX_ENTRIES
+    server.RESPONSE_CACHE_MAX_ENTRIES = 3
+    try:
+        for i in range(3):
+            server._cache_set(("k", i), i, 60)
+
+        # Overwriting an existing key must not evict
+        server._cache_set(("k", 1), 1, 60)
+        assert len(server._response_cache) == 3, "Overwrite evicted an entry"
+
+        server._cache_set(("k", 3), 3, 60)
+        assert len(server._response_cache) == 3, f"Cache grew to {len(server._response_cache)}"
+        assert server._cache_get(("k", 0)) is None, "Oldest entry not evicted"
+        assert server._cache_get(("k", 3)) == 3, "Newest entry missing"
+    finally:
+        server.RESPONSE_CACHE_MAX_ENTRIES = max_entries
+    print("✅ Cache eviction working")
+
+
+def test_fallback_recipe_not_cached():
+    # Fallback recipes are returned but never cached
+    server._response_cache.clear()
+    agents = dict(server.AGENTS)
+    server.AGENTS["recipe"] = StubRecipeAgent()
+    try:
+        request = server.RecipeRequest(ingredients=["tomato", "basil"])
+        response = asyncio.run(server.generate_recipe(request))
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert b"tomato" in response.body, "Fallback recipe missing ingredients"
+        assert not server._response_cache, "Fallback recipe was cached"
+    finally:
+        server.AGENTS.clear()
+        server.AGENTS.update(agents)
+    print("✅ Fallback recipe not cached")
+
+
+def main():
+    # Main test function
+    print("🧪 Response Cache Test")
+    print("=" * 25)
+
+    try:
+        test_cache_expiry()
+        test_cache_eviction()
+        test_fallback_recipe_not_cached()
+    except AssertionError as e:
+        print(f"❌ Cache test failed: {e}")
+        return False
+
+    print("\n🎉 All cache tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
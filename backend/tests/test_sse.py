@@ -0,0 +1,90 @@
+# SSE streaming framing tests (no LLM or running server needed)
+
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+
+# Add backend directory to Python path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import server
+
+
+class StubStreamAgent:
+    # Agent streaming fixed chunks, optionally failing afterwards
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def stream(self, prompt: str, use_tools: bool = True):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise RuntimeError(self.error)
+
+
+async def collect_events(agent) -> list:
+    # Gather all SSE frames from an agent stream
+    return [event async for event in server._stream_agent(agent, "prompt")]
+
+
+def test_sse_event_format():
+    # Data-only and named events
+    assert server._sse_event({"content": "hi"}) == b'data: {"content":"hi"}\n\n'
+    assert server._sse_event({"success": True}, event="done") == b'event: done\ndata: {"success":true}\n\n'
+    print("✅ SSE event format working")
+
+
+def test_stream_agent_done():
+    # Content frames followed by a done event
+    events = asyncio.run(collect_events(StubStreamAgent(["Hel", "lo"])))
+    assert len(events) == 3, f"Expected 3 events, got {len(events)}"
+    assert orjson.loads(events[0][len(b"data: "):]) == {"content": "Hel"}
+    assert orjson.loads(events[1][len(b"data: "):]) == {"content": "lo"}
+    assert events[2].startswith(b"event: done\ndata: "), f"Bad done event: {events[2]}"
+    print("✅ SSE done event working")
+
+
+def test_stream_agent_error():
+    # Agent failure ends the stream with an error event
+    events = asyncio.run(collect_events(StubStreamAgent(["partial"], error="boom")))
+    assert len(events) == 2, f"Expected 2 events, got {len(events)}"
+    assert events[1].startswith(b"event: error\ndata: "), f"Bad error event: {events[1]}"
+    payload = orjson.loads(events[1].split(b"data: ", 1)[1])
+    assert payload == {"success": False, "error": "boom"}, f"Bad error payload: {payload}"
+    print("✅ SSE error event working")
+
+
+def test_sse_response_headers():
+    # Proxies must not buffer or cache the stream
+    response = server._sse_response(server._stream_agent(StubStreamAgent([]), "prompt"))
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
+    print("✅ SSE response headers working")
+
+
+def main():
+    # Main test function
+    print("🧪 SSE Streaming Test")
+    print("=" * 25)
+
+    try:
+        test_sse_event_format()
+        test_stream_agent_done()
+        test_stream_agent_error()
+        test_sse_response_headers()
+    except AssertionError as e:
+        print(f"❌ SSE test failed: {e}")
+        return False
+
+    print("\n🎉 All SSE tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)